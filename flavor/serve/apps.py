@@ -3,8 +3,9 @@ from typing import Callable, Optional, Sequence, Type
 
 import gradio as gr
 import uvicorn
+from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI, Response, status
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .invocations import InferInvocationAPP
@@ -15,7 +16,7 @@ __all__ = ["InferAPP", "GradioInferAPP"]
 class BaseAPP(object):
     def __init__(self):
 
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=ORJSONResponse)
 
         # Add a 'ping' endpoint for health checks or service availability checks
         self.app.add_api_route(
@@ -28,9 +29,17 @@ class BaseAPP(object):
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     def run(self, host="0.0.0.0", port=9000, log_level="error"):
-        # Run the FastAPI application using uvicorn
+        # Run the FastAPI application using uvicorn with the faster uvloop
+        # event loop and httptools HTTP parser
         print(f"listen on port {port}")
-        uvicorn.run(self.app, host=host, port=port, log_level=log_level)
+        uvicorn.run(
+            self.app,
+            host=host,
+            port=port,
+            log_level=log_level,
+            loop="uvloop",
+            http="httptools",
+        )
 
 
 class InferAPP(BaseAPP):
@@ -49,8 +58,8 @@ class InferAPP(BaseAPP):
             app=InferInvocationAPP(infer_function, input_data_model, output_data_model).app,
         )
 
-        # Add middleware to compress responses using gzip
-        self.app.add_middleware(GZipMiddleware)
+        # Add middleware to compress responses using Brotli (with gzip fallback)
+        self.app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
 
 
 class CustomAPP(BaseAPP):
@@ -67,7 +76,7 @@ class CustomAPP(BaseAPP):
             app=invocation_app.app,
         )
 
-        self.app.add_middleware(GZipMiddleware)
+        self.app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
 
 
 class GradioInferAPP:
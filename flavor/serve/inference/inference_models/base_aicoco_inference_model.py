@@ -2,11 +2,14 @@ from abc import abstractmethod
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from ..data_models.functional import AiImage
 from .base_inference_model import BaseInferenceModel
 
+# Compiled once so image lists are validated in a single C-level pass.
+AI_IMAGES_ADAPTER = TypeAdapter(List[AiImage])
+
 
 class InferCategory(BaseModel):
     name: str
@@ -18,6 +21,10 @@ class InferRegression(BaseModel):
     superregression_name: Optional[str] = None
 
 
+INFER_CATEGORIES_ADAPTER = TypeAdapter(List[InferCategory])
+INFER_REGRESSIONS_ADAPTER = TypeAdapter(List[InferRegression])
+
+
 class BaseAiCOCOInferenceModel(BaseInferenceModel):
     def __init__(self):
         self.network = self.define_inference_network()
@@ -33,10 +40,7 @@ class BaseAiCOCOInferenceModel(BaseInferenceModel):
         """
         if self.categories is not None:
             if isinstance(self.categories, Sequence):
-                if not all(InferCategory.model_validate(c) for c in self.categories):
-                    raise ValueError(
-                        "Not all elements in `self.categories` is valid for category structure."
-                    )
+                INFER_CATEGORIES_ADAPTER.validate_python(self.categories)
             else:
                 raise TypeError("`categories` should have type of `Sequence[InferCategory]`.")
 
@@ -46,10 +50,7 @@ class BaseAiCOCOInferenceModel(BaseInferenceModel):
         """
         if self.regressions is not None:
             if isinstance(self.regressions, Sequence):
-                if not all(InferRegression.model_validate(c) for c in self.regressions):
-                    raise ValueError(
-                        "Not all elements in `self.regressions` is valid for regression structure."
-                    )
+                INFER_REGRESSIONS_ADAPTER.validate_python(self.regressions)
             else:
                 raise TypeError("`regressions` should have type of `Sequence[InferRegression]`.")
 
@@ -229,31 +230,45 @@ class BaseAiCOCOImageInferenceModel(BaseAiCOCOInferenceModel):
 
         # set `self.images` by the order of its index attribute.
         if not files:
-            for sorted_img in sorted(images, key=lambda x: x["index"]):
-                self.images.append(AiImage.model_validate(sorted_img))
+            self.images = AI_IMAGES_ADAPTER.validate_python(
+                sorted(images, key=lambda x: x["index"])
+            )
             return
 
-        assert len(files) == len(set(files)), "Each element of `files` should be unique."
-        m = len(set(files))
-        n = len(set([img["file_name"] for img in images]))
+        unique_files = set(files)
+        assert len(files) == len(unique_files), "Each element of `files` should be unique."
+
+        sorted_images = sorted(images, key=lambda x: x["index"])
+
+        # Normalize each image's file name once and bucket images by it, so
+        # each `target_file` is matched with O(1) suffix lookups instead of
+        # scanning every image. The buckets double as the unique file_name set.
+        image_buckets: Dict[str, List[Dict[str, Any]]] = {}
+        for image in sorted_images:
+            image_file_name = image["file_name"].replace("/", "@@@")
+            image_buckets.setdefault(image_file_name, []).append(image)
+        suffix_lengths = sorted(set(len(name) for name in image_buckets))
+
+        m = len(unique_files)
+        n = len(image_buckets)
         assert (
             m == n
         ), f"The number of `files` and `file_name` in `images` is not valid. `files` has {m} unique elements but file_name in `images` has {n} unique elements."
 
-        sorted_images = sorted(images, key=lambda x: x["index"])
-
+        matched_images = []
         for target_file in files:
             # Ideally, `target_file` would be `image` with some hash prefix.
             found_matched = False
-            for image in sorted_images:
-                image_file_name = image["file_name"].replace("/", "@@@")
-                if target_file.endswith(image_file_name):
+            for suffix_length in suffix_lengths:
+                for image in image_buckets.get(target_file[-suffix_length:], []):
                     found_matched = True
-                    self.images.append(AiImage.model_validate(image))
+                    matched_images.append(image)
 
             if not found_matched:
                 raise ValueError(f"{target_file} could not be found in input `images`.")
 
+        self.images = AI_IMAGES_ADAPTER.validate_python(matched_images)
+
     @abstractmethod
     def data_reader(
         self, files: Optional[Sequence[str]] = None, **kwargs
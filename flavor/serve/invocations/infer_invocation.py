@@ -8,8 +8,7 @@ from typing import Callable, Dict
 
 import aiofile
 from fastapi import FastAPI, Request, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from starlette.datastructures import UploadFile
 
@@ -35,7 +34,7 @@ class InferInvocationAPP:
         input_data_model: BaseModel,
         output_data_model: BaseModel,
     ):
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=ORJSONResponse)
         self.app.add_api_route(
             "/invocations",
             self.invocations,
@@ -99,7 +98,7 @@ class InferInvocationAPP:
 
         return input_dict
 
-    async def invocations(self, request: Request) -> JSONResponse:
+    async def invocations(self, request: Request) -> ORJSONResponse:
         """
         Handle the /invocation requests.
 
@@ -107,7 +106,7 @@ class InferInvocationAPP:
             request (Request): The FastAPI request object.
 
         Returns:
-            JSONResponse: The JSON response with the inference results or error message.
+            ORJSONResponse: The JSON response with the inference results or error message.
         """
         form_data = await request.form()
         tempdir: TemporaryDirectory = TemporaryDirectory()
@@ -123,9 +122,9 @@ class InferInvocationAPP:
         except Exception:
             err_msg = traceback.format_exc()
             logging.error(err_msg)
-            return JSONResponse(content=err_msg, status_code=status.HTTP_400_BAD_REQUEST)
+            return ORJSONResponse(content=err_msg, status_code=status.HTTP_400_BAD_REQUEST)
 
         finally:
             tempdir.cleanup()
 
-        return JSONResponse(content=jsonable_encoder(response), status_code=status.HTTP_200_OK)
+        return ORJSONResponse(content=response.model_dump(), status_code=status.HTTP_200_OK)
@@ -1,11 +1,14 @@
 import os
+import tempfile
 from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 import numpy as np
 import torch
-import torch.nn as nn
+import torchvision
 from PIL import Image
+from torchvision.io import ImageReadMode, decode_image, decode_jpeg, read_file
 from torchvision.models import ResNet18_Weights, resnet18
+from torchvision.transforms.functional import pil_to_tensor
 
 from flavor.serve.apps import InferAPP
 from flavor.serve.inference.data_models.api import (
@@ -21,12 +24,39 @@ class ClassificationInferenceModel(BaseAiCOCOImageInferenceModel):
     def __init__(self):
         self.formatter = AiCOCOClassificationOutputStrategy()
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # Build the preprocessing pipeline once instead of per request.
+        self.transforms = ResNet18_Weights.DEFAULT.transforms()
+        # Reusable pinned staging buffer and side stream for the H2D copy.
+        self._pin_buffer = None
+        self._copy_stream = torch.cuda.Stream() if self.device.type == "cuda" else None
         super().__init__()
 
     def define_inference_network(self) -> Callable:
+        # Persist a traced copy so warm starts skip eager module construction
+        # and load the serialized graph directly. The cache name is keyed on
+        # the torch/torchvision versions so an archive left behind by another
+        # install is never reused.
+        ts_path = os.path.join(
+            tempfile.gettempdir(),
+            f"flavor_cls_resnet18_{torch.__version__}_{torchvision.__version__}.pt",
+        )
+        if os.path.exists(ts_path):
+            try:
+                return torch.jit.load(ts_path, map_location=self.device).eval()
+            except Exception:
+                # A stale or corrupt archive must not poison startup; rebuild.
+                pass
         network = resnet18(ResNet18_Weights.DEFAULT)
         network.eval()
         network.to(self.device)
+        # NHWC layout unlocks the faster channels-last conv kernels.
+        network.to(memory_format=torch.channels_last)
+        example = torch.randn(1, 3, 224, 224, device=self.device).contiguous(
+            memory_format=torch.channels_last
+        )
+        with torch.no_grad():
+            network = torch.jit.trace(network, example)
+        torch.jit.save(network, ts_path)
         return network
 
     def set_categories(self) -> List[Dict[str, Any]]:
@@ -37,24 +67,70 @@ class ClassificationInferenceModel(BaseAiCOCOImageInferenceModel):
     def set_regressions(self) -> None:
         return None
 
-    def data_reader(self, files: Sequence[str], **kwargs) -> Tuple[np.ndarray, None, None]:
-        img = Image.open(files[0])
-        return img, None, None
-
-    def preprocess(self, data: np.ndarray) -> torch.Tensor:
-        transforms = ResNet18_Weights.DEFAULT.transforms()
-        img = transforms(data).unsqueeze(0).to(self.device)
-        return img
+    def data_reader(self, files: Sequence[str], **kwargs) -> Tuple[List[torch.Tensor], None, None]:
+        imgs = []
+        for file in files:
+            try:
+                raw = read_file(file)
+                if self.device.type == "cuda" and file.lower().endswith((".jpg", ".jpeg")):
+                    # nvJPEG decodes straight into a GPU tensor.
+                    img = decode_jpeg(raw, mode=ImageReadMode.RGB, device=self.device)
+                else:
+                    img = decode_image(raw, mode=ImageReadMode.RGB)
+            except RuntimeError:
+                # Fall back to PIL for formats torchvision.io cannot decode.
+                img = pil_to_tensor(Image.open(file).convert("RGB"))
+            # CPU-decoded images stay on CPU; `preprocess` moves them to the
+            # device through the pinned staging path after the transforms.
+            imgs.append(img)
+        return imgs, None, None
+
+    def preprocess(self, data: List[torch.Tensor]) -> torch.Tensor:
+        # Transforms run on whatever device each image was decoded on, so only
+        # the resized 224x224 tensors of CPU-decoded images cross the PCIe bus.
+        imgs = [self.transforms(img) for img in data]
+
+        if self._copy_stream is not None:
+            cpu_idx = [i for i, img in enumerate(imgs) if img.device.type == "cpu"]
+            if cpu_idx:
+                # Stage the CPU-decoded images in pinned memory and issue the
+                # copy on a side stream so the PCIe transfer overlaps with
+                # work on the default stream.
+                staged = torch.stack([imgs[i] for i in cpu_idx]).contiguous(
+                    memory_format=torch.channels_last
+                )
+                if self._pin_buffer is None or self._pin_buffer.shape != staged.shape:
+                    self._pin_buffer = torch.empty_like(staged, pin_memory=True)
+                self._pin_buffer.copy_(staged)
+                with torch.cuda.stream(self._copy_stream):
+                    staged = self._pin_buffer.to(self.device, non_blocking=True)
+
+                if len(cpu_idx) == len(imgs):
+                    # The whole batch went through staging; `inference` waits
+                    # on the copy stream before consuming it.
+                    return staged
+
+                # Mixed batch: the stack below consumes the staged copy on the
+                # default stream, so synchronize before gathering.
+                torch.cuda.current_stream().wait_stream(self._copy_stream)
+                for slot, idx in enumerate(cpu_idx):
+                    imgs[idx] = staged[slot]
+
+        batch = torch.stack(imgs).to(self.device)
+        return batch.contiguous(memory_format=torch.channels_last)
 
     def inference(self, x: torch.Tensor) -> torch.Tensor:
-        with torch.no_grad():
+        if self._copy_stream is not None:
+            torch.cuda.current_stream().wait_stream(self._copy_stream)
+        with torch.inference_mode():
             out = self.network(x)
         return out
 
     def postprocess(self, model_out: torch.Tensor, **kwargs) -> np.ndarray:
-        model_out = model_out.squeeze(0).cpu().detach()
-        model_out = (nn.functional.softmax(model_out, dim=0) > 0.4).long()
-        return model_out.numpy()
+        # Softmax, threshold and batch reduction stay on-device; only the
+        # final uint8 multi-hot vector crosses to host memory.
+        mask = (model_out.softmax(dim=1) > 0.4).any(dim=0)
+        return mask.to(torch.uint8).cpu().numpy()
 
     def output_formatter(
         self,